@@ -36,6 +36,17 @@ variable "project_name" {
   default     = "file-processor"
 }
 
+variable "max_workers" {
+  description = "Maximum number of files processed in parallel per Lambda invocation"
+  type        = number
+  default     = 16
+
+  validation {
+    condition     = var.max_workers >= 1 && floor(var.max_workers) == var.max_workers
+    error_message = "max_workers must be a whole number greater than or equal to 1."
+  }
+}
+
 # S3 Buckets
 resource "aws_s3_bucket" "input_bucket" {
   bucket = "${var.project_name}-input-bucket"
@@ -129,13 +140,21 @@ resource "aws_iam_role_policy" "lambda_policy" {
         Action = [
           "s3:GetObject",
           "s3:PutObject",
-          "s3:DeleteObject"
+          "s3:DeleteObject",
+          "s3:AbortMultipartUpload"
         ]
         Resource = [
           "${aws_s3_bucket.input_bucket.arn}/*",
           "${aws_s3_bucket.output_bucket.arn}/*"
         ]
       },
+      {
+        Effect = "Allow"
+        Action = [
+          "s3:ListBucket"
+        ]
+        Resource = aws_s3_bucket.output_bucket.arn
+      },
       {
         Effect = "Allow"
         Action = [
@@ -177,6 +196,7 @@ resource "aws_lambda_function" "file_processor" {
       OUTPUT_BUCKET = aws_s3_bucket.output_bucket.bucket
       SNS_TOPIC_ARN = aws_sns_topic.file_processed.arn
       SECRET_ARN    = aws_secretsmanager_secret.api_key.arn
+      MAX_WORKERS   = var.max_workers
     }
   }
 